@@ -1,19 +1,193 @@
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Iterator
-
-import requests
+import copy
+import sys
+import time
+from datetime import datetime
+from datetime import timezone
+from functools import lru_cache
+from operator import itemgetter
+from types import TracebackType
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import httpx
+import orjson
 
 from onyx.configs.app_configs import INDEX_BATCH_SIZE
+from onyx.configs.app_configs import REQUEST_TIMEOUT_SECONDS
 from onyx.configs.constants import DocumentSource
-from onyx.connectors.interfaces import (
-    CheckpointedConnectorWithPermSync,
-    SlimConnectorWithPermSync,
-)
+from onyx.connectors.interfaces import CheckpointedConnectorWithPermSync
+from onyx.connectors.interfaces import CheckpointOutput
+from onyx.connectors.interfaces import GenerateDocumentsOutput
+from onyx.connectors.interfaces import GenerateSlimDocumentOutput
+from onyx.connectors.interfaces import SecondsSinceUnixEpoch
+from onyx.connectors.interfaces import SlimConnectorWithPermSync
+from onyx.connectors.models import BasicExpertInfo
 from onyx.connectors.models import ConnectorCheckpoint
+from onyx.connectors.models import ConnectorMissingCredentialError
+from onyx.connectors.models import Document
+from onyx.connectors.models import TextSection
+from onyx.file_processing.html_utils import parse_html_page_basic
+from onyx.file_processing.html_utils import strip_excessive_newlines_and_spaces
+from onyx.file_processing.html_utils import strip_newlines
+from onyx.indexing.indexing_heartbeat import IndexingHeartbeatInterface
+from onyx.utils.logger import setup_logger
+from onyx.utils.retry_wrapper import retry_builder
+from onyx.utils.threadpool_concurrency import run_in_background
+from onyx.utils.threadpool_concurrency import TimeoutThread
+from onyx.utils.threadpool_concurrency import wait_on_background
+
+logger = setup_logger()
+
+BASE_URL = "https://api.intercom.io"
+APP_URL_PREFIX = "https://app.intercom.com/a/apps/"
+INTERCOM_ID_PREFIX = "intercom_"
+INTERCOM_API_VERSION = "2.9"  # Pin the API version for stability
+INTERCOM_PAGE_SIZE = 150  # Intercom API maximum
+_CLEANED_BODY_CACHE_SIZE = 4096
+# Pages fetched per load_from_checkpoint call before a checkpoint is returned
+_PAGES_PER_CHECKPOINT = 10
+_tag_name = itemgetter("name")
+_RETRIABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Upper bound on a single Retry-After wait, so one bad header can't stall the
+# fetch thread indefinitely
+_MAX_RETRY_AFTER_SECONDS = 60
+# Conversation part authors that aren't counted as document owners
+_NON_PARTICIPANT_AUTHOR_TYPES = {"bot"}
+_NON_PARTICIPANT_PART_TYPES = {
+    "assignment",
+    "default_assignment",
+    "away_mode_assignment",
+}
+# Requests are paused once less than this fraction of the rate limit remains
+_RATE_LIMIT_HEADROOM = 0.1
+# Intercom distributes its limit over 10 second windows
+_MAX_RATE_LIMIT_WAIT_SECONDS = 10
+
+
+def _build_link_template(workspace_id: Optional[str]) -> Optional[str]:
+    """Conversation link with a `{}` placeholder for the conversation id."""
+    if not workspace_id:
+        return None
+    return f"{APP_URL_PREFIX}{workspace_id}/conversations/{{}}"
+
+
+def _wait_for_rate_limit(headers: httpx.Headers) -> None:
+    """
+    Sleeps until the rate limit window resets when the `X-RateLimit-*` headers
+    show the quota is nearly used up, so pagination slows down before Intercom
+    starts rejecting requests with 429s.
+    """
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        limit = int(headers["X-RateLimit-Limit"])
+        reset_at = int(headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return
+
+    if remaining >= limit * _RATE_LIMIT_HEADROOM:
+        return
+
+    wait = min(reset_at - time.time(), _MAX_RATE_LIMIT_WAIT_SECONDS)
+    if wait > 0:
+        logger.info(
+            f"Intercom rate limit nearly exhausted ({remaining}/{limit} left), "
+            f"waiting {wait:.1f}s for the window to reset"
+        )
+        time.sleep(wait)
+
+
+class IntercomRetriableError(Exception):
+    """Raised for retriable Intercom conditions (429, 5xx)."""
+
+
+@retry_builder(
+    tries=6,
+    delay=0.5,
+    backoff=2,
+    max_delay=30,
+    exceptions=(IntercomRetriableError, httpx.TransportError),
+)
+def _intercom_request(
+    client: httpx.Client, method: str, url: str, **kwargs: Any
+) -> httpx.Response:
+    """Perform a request against the Intercom API, retrying on 429, 5xx and
+    transport errors. Honors the `Retry-After` header of a 429 before retrying.
+    """
+    response = client.request(method, url, **kwargs)
+    status = response.status_code
+    if status in _RETRIABLE_STATUS_CODES:
+        if status == 429 and (retry_after := response.headers.get("Retry-After")):
+            try:
+                time.sleep(min(int(retry_after), _MAX_RETRY_AFTER_SECONDS))
+            except ValueError:
+                pass
+        raise IntercomRetriableError(f"Intercom request failed with status {status}")
+
+    response.raise_for_status()
+    _wait_for_rate_limit(response.headers)
+    return response
+
+
+def _utc_iso(ts: int) -> str:
+    """
+    Formats a unix timestamp the way datetime.isoformat() does for a UTC
+    datetime (Intercom timestamps are whole seconds), without building one.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(ts))
+
+
+def _iter_messages(
+    ticket: Dict[str, Any], source: Dict[str, Any]
+) -> Iterator[tuple[Optional[str], Dict[str, Any]]]:
+    """
+    Yields `(body, author)` for every message of a ticket, the initial message
+    first. Either may be empty. Parts written by bots and assignment events
+    are yielded with an empty author, since nobody there took part in the
+    conversation.
+    """
+    yield source.get("body"), source.get("author") or {}
+
+    conversation_parts = (ticket.get("conversation_parts") or {}).get(
+        "conversation_parts"
+    ) or []
+    for part in conversation_parts:
+        author = part.get("author") or {}
+        if (
+            author.get("type") in _NON_PARTICIPANT_AUTHOR_TYPES
+            or part.get("part_type") in _NON_PARTICIPANT_PART_TYPES
+        ):
+            author = {}
+        yield part.get("body"), author
+
+
+@lru_cache(maxsize=_CLEANED_BODY_CACHE_SIZE)
+def _clean_body(body: str) -> str:
+    """
+    Cleans the HTML of a single message body. Replies in long threads often quote
+    earlier messages verbatim, so results are cached across calls.
+    """
+    if "<" not in body and "&" not in body:
+        # Plain text - this is what the HTML parser would produce, without the parse
+        return strip_excessive_newlines_and_spaces(strip_newlines(body))
+    # lxml parses these fragments several times faster than html.parser, but
+    # drops everything after a leading stray end tag (e.g. "</p><p>Thanks</p>"),
+    # so an empty result is re-parsed with html.parser
+    return parse_html_page_basic(body, parser="lxml") or parse_html_page_basic(body)
 
 
 class IntercomConnectorCheckpoint(ConnectorCheckpoint):
+    # Cursor for the next page of the current query, and the `updated_at`
+    # lower bound of the search it belongs to
     tickets_cursor: Optional[str] = None
+    cursor_start_ts: Optional[int] = None
+
+    # Newest `updated_at` already yielded, and the ids of the tickets updated at
+    # exactly that second, so a resumed search can start there without repeats
+    last_updated_at: Optional[int] = None
+    last_updated_ids: List[str] = []
 
 
 class IntercomConnector(
@@ -28,6 +202,47 @@ class IntercomConnector(
         self.batch_size = batch_size
         self.intercom_api_token: Optional[str] = None
         self.workspace_id = workspace_id
+        self._link_template = _build_link_template(workspace_id)
+        self._client: Optional[httpx.Client] = None
+
+    def __enter__(self) -> "IntercomConnector":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        client = getattr(self, "_client", None)
+        if client is None:
+            return
+
+        client.close()
+        self._client = None
+
+    def _build_client(self, intercom_api_token: str) -> httpx.Client:
+        """
+        Builds a single HTTP/2 client so that every page request is multiplexed
+        over the same connection instead of paying a new TLS handshake.
+        """
+        return httpx.Client(
+            http2=True,
+            base_url=BASE_URL,
+            headers={
+                "Authorization": f"Bearer {intercom_api_token}",
+                "Accept": "application/json",
+                "Intercom-Version": INTERCOM_API_VERSION,
+            },
+            timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
 
     def load_credentials(self, credentials: dict[str, Any]) -> None:
         """
@@ -39,131 +254,249 @@ class IntercomConnector(
                 "Missing or invalid 'intercom_api_token' for Intercom connector."
             )
         self.intercom_api_token = intercom_api_token
+        self.close()
+        self._client = self._build_client(intercom_api_token)
 
         self.workspace_id = credentials.get("workspace_id")
         if not self.workspace_id:
             raise ConnectorMissingCredentialError(
                 "Missing or invalid 'workspace_id' for Intercom connector."
             )
+        self._link_template = _build_link_template(self.workspace_id)
 
-    def _ticket_to_document(self, ticket: Dict[str, Any]) -> Document:
+    def _ticket_to_document(
+        self, ticket: Dict[str, Any], *, updated_at: datetime
+    ) -> Document:
         """
         Transforms a single Intercom ticket (conversation) into a Document object.
+        `updated_at` is the already-converted `ticket["updated_at"]`, so the
+        timestamp isn't parsed a second time.
         """
-        source = ticket.get("source", {})
-        author = source.get("author", {})
-
-        # Create primary_owners list only if an author with an email exists
-        primary_owners = (
-            [BasicExpertInfo(display_name=author.get("name"), email=author.get("email"))]
-            if author and author.get("email")
-            else []
-        )
-
-        # Combine the initial message and all subsequent parts into sections
-        sections = []
-        # Use the parser to clean the HTML from the ticket body
-        if source.get("body"):
-            cleaned_text = parse_html_page_basic(source["body"])
-            if cleaned_text:
-                sections.append(TextSection(text=cleaned_text))
-
-        conversation_parts = ticket.get("conversation_parts", {}).get(
-            "conversation_parts", []
-        )
-        for part in conversation_parts:
-            # Use the parser here as well for all subsequent conversation parts
-            if part.get("body"):
-                cleaned_text = parse_html_page_basic(part["body"])
-                if cleaned_text:
-                    sections.append(TextSection(text=cleaned_text))
-
-        # Get and convert numeric IDs to strings to prevent validation errors
-        assignee_id = ticket.get("admin_assignee_id")
-        team_assignee_id = ticket.get("team_assignee_id")
-
-        metadata = {
-            "created_at": datetime.fromtimestamp(
-                ticket["created_at"], tz=timezone.utc
-            ).isoformat(),
-            "state": ticket.get("state"),
-            "assignee_id": str(assignee_id) if assignee_id is not None else None,
-            "team_assignee_id": str(team_assignee_id)
-            if team_assignee_id is not None
-            else None,
-            "tags": [tag["name"] for tag in ticket.get("tags", {}).get("tags", [])],
-            "priority": ticket.get("priority", "not_prioritized"),
-            "source_type": source.get("type"),
+        # Each nested container is looked up once; Intercom returns explicit
+        # nulls for some of them, hence `or {}` rather than a .get default
+        source = ticket.get("source") or {}
+        ticket_id = str(ticket["id"])
+
+        # Combine the initial message and all subsequent parts into sections,
+        # cleaning the HTML of each, and collect the authors in the same pass.
+        # The initial message's author is the primary owner, everyone who
+        # replied is a secondary owner. Owners are keyed by email so each is
+        # only listed once.
+        sections: List[TextSection] = []
+        owners: dict[str, BasicExpertInfo] = {}
+        # Bound once since these are hit for every message of every ticket
+        sections_append = sections.append
+        text_section = TextSection.model_construct
+        expert_info = BasicExpertInfo.model_construct
+        clean_body = _clean_body
+        # Identical bodies (e.g. repeated quoted replies) are only embedded once
+        seen_texts: set[str] = set()
+        for body, author in _iter_messages(ticket, source):
+            if (email := author.get("email")) and email not in owners:
+                owners[email] = expert_info(
+                    display_name=author.get("name"), email=email
+                )
+
+            if not body:
+                continue
+            cleaned_text = clean_body(body)
+            if cleaned_text and cleaned_text not in seen_texts:
+                seen_texts.add(cleaned_text)
+                sections_append(text_section(text=cleaned_text))
+
+        author_email = (source.get("author") or {}).get("email")
+        primary_owners = [owners.pop(author_email)] if author_email else []
+
+        # Only keys with a value are inserted, so there is no filtering pass.
+        # State, priority, source type and tag names take only a handful of
+        # distinct values, so they are interned and shared between documents
+        # rather than kept as a fresh string per ticket.
+        intern = sys.intern
+        metadata: dict[str, str | list[str]] = {
+            "created_at": _utc_iso(ticket["created_at"]),
         }
-
-        return Document(
-            id=f"{INTERCOM_ID_PREFIX}{ticket['id']}",
+        if (state := ticket.get("state")) is not None:
+            metadata["state"] = intern(state)
+        # Convert numeric IDs to strings to prevent validation errors
+        if (assignee_id := ticket.get("admin_assignee_id")) is not None:
+            metadata["assignee_id"] = str(assignee_id)
+        if (team_assignee_id := ticket.get("team_assignee_id")) is not None:
+            metadata["team_assignee_id"] = str(team_assignee_id)
+
+        # Most tickets have no tags, so skip building a list for them entirely
+        tags_container = ticket.get("tags")
+        tag_list = tags_container.get("tags") if tags_container else None
+        if tag_list:
+            metadata["tags"] = [intern(name) for name in map(_tag_name, tag_list)]
+
+        if (priority := ticket.get("priority", "not_prioritized")) is not None:
+            metadata["priority"] = intern(priority)
+        if (source_type := source.get("type")) is not None:
+            metadata["source_type"] = intern(source_type)
+
+        # Every field below is already coerced to its model type (ids to str,
+        # timestamps to datetime/ISO str), so pydantic validation is skipped
+        return Document.model_construct(
+            id=f"{INTERCOM_ID_PREFIX}{ticket_id}",
             source=DocumentSource.INTERCOM,
-            semantic_identifier=ticket.get("title") or f"Conversation {ticket['id']}",
-            link=self.get_source_link(ticket['id']),
-            doc_updated_at=datetime.fromtimestamp(ticket["updated_at"], tz=timezone.utc),
+            semantic_identifier=ticket.get("title") or f"Conversation {ticket_id}",
+            link=self.get_source_link(ticket_id),
+            doc_updated_at=updated_at,
             primary_owners=primary_owners,
+            secondary_owners=list(owners.values()) or None,
             sections=sections,
             # Intercom API does not provide a way to get permissions for a specific ticket
             external_access=None,
-            # Clean up metadata by removing keys with None or empty values
-            metadata={k: v for k, v in metadata.items() if v is not None and v != []},
+            metadata=metadata,
         )
 
-    def _get_tickets(self, starting_after: Optional[str] = None) -> Dict[str, Any]:
+    def _get_tickets(
+        self,
+        start_ts: SecondsSinceUnixEpoch,
+        starting_after: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
-        Fetches a single page of conversations from the Intercom API.
+        Fetches a single page of conversations updated after `start_ts` from the
+        Intercom search endpoint, sorted by `updated_at` ascending. The filter is
+        applied by the server, so a full index simply passes 0.
         """
-        if not self.intercom_api_token:
+        if not self.intercom_api_token or self._client is None:
             raise ConnectorMissingCredentialError("Intercom API token is not loaded.")
 
-        params = {"per_page": 50}
+        pagination: Dict[str, Any] = {"per_page": INTERCOM_PAGE_SIZE}
         if starting_after:
-            params["starting_after"] = starting_after
-
-        response = requests.get(
-            f"{BASE_URL}/conversations",
-            headers={
-                "Authorization": f"Bearer {self.intercom_api_token}",
-                "Accept": "application/json",
-                "Intercom-Version": "2.9",  # Specify API version for stability
+            pagination["starting_after"] = starting_after
+
+        response = _intercom_request(
+            self._client,
+            "POST",
+            "/conversations/search",
+            json={
+                "query": {
+                    "field": "updated_at",
+                    "operator": ">",
+                    "value": int(start_ts),
+                },
+                "pagination": pagination,
+                "sort": {"field": "updated_at", "order": "ascending"},
             },
-            params=params,
         )
-        response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def _fetch_tickets(
-        self, checkpoint: IntercomConnectorCheckpoint, start_time: Optional[datetime] = None
+        self,
+        checkpoint: IntercomConnectorCheckpoint,
+        start_ts: SecondsSinceUnixEpoch,
+        end_ts: SecondsSinceUnixEpoch,
+        max_pages: Optional[int] = None,
     ) -> GenerateDocumentsOutput:
         """
         Continuously fetches batches of tickets from Intercom, handling pagination.
+
+        Results come from the search endpoint sorted by `updated_at` ascending,
+        so the first ticket past `end_ts` means every remaining ticket (on this
+        and later pages) is out of the window as well and pagination stops there.
+
+        Both bounds are unix timestamps and are compared against each ticket's
+        raw `updated_at`, a datetime is only built for tickets that are yielded.
+
+        The request for the next page is issued in the background as soon as its
+        cursor is known, so the HTTP round-trip overlaps with converting the
+        current page. At most one page is ever in flight, and since this is a
+        generator no page beyond that is requested until the consumer has pulled
+        every batch of the current one. No page is prefetched past `max_pages`
+        or the end of the window, as it would only be thrown away.
+
+        After every page the checkpoint is updated in place with the cursor of
+        the next page and the newest `updated_at` seen along with the ids that
+        share it. Stops after `max_pages` pages if given, leaving
+        `checkpoint.has_more` set so the caller can resume.
         """
         doc_batch: List[Document] = []
+        # Re-captured whenever doc_batch is swapped for a fresh list
+        append_doc = doc_batch.append
         starting_after = checkpoint.tickets_cursor
 
-        while True:
-            response = self._get_tickets(starting_after=starting_after)
+        # Bound once outside the per-ticket loop
+        to_document = self._ticket_to_document
+        from_timestamp = datetime.fromtimestamp
+        utc = timezone.utc
+        batch_size = self.batch_size
+
+        # Tickets at exactly the resumed watermark that were already yielded
+        resume_watermark = checkpoint.last_updated_at
+        skip_ids = set(checkpoint.last_updated_ids)
+        watermark = resume_watermark
+        watermark_ids = list(checkpoint.last_updated_ids)
+        pages_done = 0
+        checkpoint.has_more = True
+
+        next_page: TimeoutThread[Dict[str, Any]] | None = run_in_background(
+            self._get_tickets, start_ts=start_ts, starting_after=starting_after
+        )
+        while next_page is not None:
+            response = wait_on_background(next_page)
+            next_page = None
+            pages_done += 1
             tickets = response.get("conversations", [])
 
+            # Safely get the next page cursor
+            next_page_info = response.get("pages", {}).get("next")
+            starting_after = (
+                next_page_info.get("starting_after") if next_page_info else None
+            )
+            # Sorted ascending, so once the last ticket of this page is past the
+            # window no later page can have anything in it
+            past_window = bool(tickets) and tickets[-1]["updated_at"] > end_ts
+            if starting_after is None or past_window:
+                starting_after = None  # No more pages
+                checkpoint.has_more = False
+            elif max_pages is None or pages_done < max_pages:
+                next_page = run_in_background(
+                    self._get_tickets, start_ts=start_ts, starting_after=starting_after
+                )
+            # Otherwise this was the last page allowed for this call. Nothing is
+            # prefetched, the next call continues from the cursor written below.
+
             for ticket in tickets:
-                updated_at = datetime.fromtimestamp(ticket["updated_at"], tz=timezone.utc)
-                if start_time and updated_at < start_time:
+                updated_at_ts = ticket["updated_at"]
+                if updated_at_ts > end_ts:
+                    # Nothing after this is in range, pagination already
+                    # stopped above since the page's last ticket is past it too
+                    break
+
+                ticket_id = str(ticket["id"])
+                if updated_at_ts == resume_watermark and ticket_id in skip_ids:
                     continue
-
-                doc_batch.append(self._ticket_to_document(ticket))
-
-                if len(doc_batch) >= self.batch_size:
+                if watermark is None or updated_at_ts > watermark:
+                    watermark = updated_at_ts
+                    watermark_ids = [ticket_id]
+                elif updated_at_ts == watermark:
+                    watermark_ids.append(ticket_id)
+
+                append_doc(
+                    to_document(
+                        ticket, updated_at=from_timestamp(updated_at_ts, tz=utc)
+                    )
+                )
+
+                if len(doc_batch) >= batch_size:
                     yield doc_batch
+                    # A yielded batch belongs to the caller, who may still hold
+                    # it, so it is never cleared and reused
                     doc_batch = []
+                    append_doc = doc_batch.append
 
-            # Safely get the next page cursor
-            next_page_info = response.get("pages", {}).get("next")
-            if next_page_info and "starting_after" in next_page_info:
-                starting_after = next_page_info["starting_after"]
-                checkpoint.tickets_cursor = starting_after
-            else:
-                break  # No more pages
+            # Release this page's JSON tree before blocking on the next one, so
+            # at most the in-flight page is held alongside the current batch
+            del response, tickets
+
+            checkpoint.tickets_cursor = starting_after
+            checkpoint.cursor_start_ts = (
+                int(start_ts) if checkpoint.tickets_cursor else None
+            )
+            checkpoint.last_updated_at = watermark
+            checkpoint.last_updated_ids = watermark_ids
 
         if doc_batch:
             yield doc_batch
@@ -174,26 +507,36 @@ class IntercomConnector(
         end: SecondsSinceUnixEpoch,
         checkpoint: IntercomConnectorCheckpoint,
     ) -> CheckpointOutput[IntercomConnectorCheckpoint]:
-        start_time = datetime.fromtimestamp(start, tz=timezone.utc)
-        for doc_batch in self._fetch_tickets(checkpoint, start_time):
-            yield doc_batch
+        checkpoint = copy.deepcopy(checkpoint)
+        last_updated_at = checkpoint.last_updated_at
+        if checkpoint.tickets_cursor and checkpoint.cursor_start_ts is not None:
+            # Keep paging the search the cursor belongs to. Restarting from the
+            # watermark instead would never get past a single `updated_at`
+            # second shared by more tickets than one call reads (e.g. after a
+            # bulk close), since every call would re-read the same pages.
+            start = checkpoint.cursor_start_ts
+        else:
+            # A cursor without its query can't be resumed safely
+            checkpoint.tickets_cursor = None
+            if last_updated_at is not None and last_updated_at > start:
+                # Resume from the newest ticket already indexed rather than
+                # `start`. Start one second earlier so tickets sharing the
+                # watermark second are returned again; the ones already yielded
+                # are skipped by id.
+                start = last_updated_at - 1
+
+        for doc_batch in self._fetch_tickets(
+            checkpoint, start, end, max_pages=_PAGES_PER_CHECKPOINT
+        ):
+            yield from doc_batch
         return checkpoint
 
     def get_source_link(self, doc_id: str, **kwargs: Any) -> Optional[str]:
-        if not self.workspace_id:
+        if self._link_template is None:
             return None
 
         # doc_id from the index has a prefix, remove it for the URL
-        conversation_id = doc_id.replace(INTERCOM_ID_PREFIX, "")
-        return f"{APP_URL_PREFIX}{self.workspace_id}/conversations/{conversation_id}"
-
-    def load_from_checkpoint(
-        self,
-        start: SecondsSinceUnixEpoch,
-        end: SecondsSinceUnixEpoch,
-        checkpoint: IntercomConnectorCheckpoint,
-    ) -> CheckpointOutput[IntercomConnectorCheckpoint]:
-        raise NotImplementedError
+        return self._link_template.format(doc_id.removeprefix(INTERCOM_ID_PREFIX))
 
     def load_from_checkpoint_with_perm_sync(
         self,
@@ -216,5 +559,7 @@ class IntercomConnector(
             has_more=True,
         )
 
-    def validate_checkpoint_json(self, checkpoint_json: str) -> IntercomConnectorCheckpoint:
-        return IntercomConnectorCheckpoint.model_validate_json(checkpoint_json)
\ No newline at end of file
+    def validate_checkpoint_json(
+        self, checkpoint_json: str
+    ) -> IntercomConnectorCheckpoint:
+        return IntercomConnectorCheckpoint.model_validate_json(checkpoint_json)
@@ -0,0 +1,289 @@
+from collections.abc import Callable
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import onyx.connectors.intercom.connector as intercom_module
+from onyx.configs.constants import DocumentSource
+from onyx.connectors.intercom.connector import IntercomConnector
+from onyx.connectors.intercom.connector import IntercomConnectorCheckpoint
+from onyx.connectors.models import Document
+from tests.unit.onyx.connectors.utils import load_everything_from_checkpoint_connector
+from tests.unit.onyx.connectors.utils import (
+    load_everything_from_checkpoint_connector_from_checkpoint,
+)
+
+
+@pytest.fixture
+def intercom_connector() -> Generator[IntercomConnector, None, None]:
+    """Create an Intercom connector with the page fetch mocked out"""
+    connector = IntercomConnector(batch_size=2, workspace_id="test_workspace")
+    connector._get_tickets = MagicMock()  # type: ignore[method-assign]
+    yield connector
+
+
+@pytest.fixture
+def create_mock_ticket() -> Callable[..., dict[str, Any]]:
+    def _create_mock_ticket(
+        id: int = 1,
+        title: str | None = "Test Ticket",
+        body: str = "Test Content",
+        created_at: int = 1_700_000_000,
+        updated_at: int = 1_700_000_100,
+        author_email: str | None = "user@example.com",
+        tags: list[str] | None = None,
+        admin_assignee_id: int | None = None,
+    ) -> dict[str, Any]:
+        """Helper to create a mock Intercom conversation"""
+        return {
+            "id": id,
+            "title": title,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "state": "open",
+            "admin_assignee_id": admin_assignee_id,
+            "team_assignee_id": None,
+            "source": {
+                "type": "conversation",
+                "body": body,
+                "author": {"name": "Test User", "email": author_email},
+            },
+            "tags": {"tags": [{"name": tag} for tag in tags or []]},
+        }
+
+    return _create_mock_ticket
+
+
+def _page(
+    tickets: list[dict[str, Any]], starting_after: str | None = None
+) -> dict[str, Any]:
+    pages: dict[str, Any] = {}
+    if starting_after:
+        pages["next"] = {"starting_after": starting_after}
+    return {"conversations": tickets, "pages": pages}
+
+
+class _FakeSearchServer:
+    """Serves `tickets` like the search endpoint: `updated_at > start_ts`,
+    sorted ascending, `page_size` per page with the offset as cursor"""
+
+    def __init__(self, tickets: list[dict[str, Any]], page_size: int) -> None:
+        self.tickets = sorted(tickets, key=lambda ticket: ticket["updated_at"])
+        self.page_size = page_size
+        self.calls: list[tuple[str | None, float | None]] = []
+
+    def __call__(
+        self, start_ts: float, starting_after: str | None = None
+    ) -> dict[str, Any]:
+        self.calls.append((starting_after, start_ts))
+        matching = [
+            ticket for ticket in self.tickets if ticket["updated_at"] > start_ts
+        ]
+        offset = int(starting_after) if starting_after else 0
+        end = offset + self.page_size
+        return _page(matching[offset:end], str(end) if end < len(matching) else None)
+
+
+def test_load_from_checkpoint_happy_path(
+    intercom_connector: IntercomConnector,
+    create_mock_ticket: Callable[..., dict[str, Any]],
+) -> None:
+    """Test loading conversations across pages - happy path"""
+    intercom_connector._get_tickets.side_effect = [  # type: ignore[attr-defined]
+        _page(
+            [
+                create_mock_ticket(id=1, updated_at=100, tags=["billing"]),
+                create_mock_ticket(id=2, updated_at=200, admin_assignee_id=42),
+            ],
+            starting_after="cursor_1",
+        ),
+        _page([create_mock_ticket(id=3, title=None, updated_at=300)]),
+    ]
+
+    outputs = load_everything_from_checkpoint_connector(intercom_connector, 0, 1_000)
+
+    assert len(outputs) == 1
+    docs = outputs[0].items
+    assert [doc.id for doc in docs if isinstance(doc, Document)] == [
+        "intercom_1",
+        "intercom_2",
+        "intercom_3",
+    ]
+
+    doc1 = docs[0]
+    assert isinstance(doc1, Document)
+    assert doc1.source == DocumentSource.INTERCOM
+    assert doc1.semantic_identifier == "Test Ticket"
+    assert doc1.link == "https://app.intercom.com/a/apps/test_workspace/conversations/1"
+    assert doc1.sections[0].text == "Test Content"
+    assert doc1.metadata["tags"] == ["billing"]
+    assert "assignee_id" not in doc1.metadata
+    assert doc1.primary_owners and doc1.primary_owners[0].email == "user@example.com"
+
+    doc2 = docs[1]
+    assert isinstance(doc2, Document)
+    assert doc2.metadata["assignee_id"] == "42"
+    assert "tags" not in doc2.metadata
+
+    doc3 = docs[2]
+    assert isinstance(doc3, Document)
+    assert doc3.semantic_identifier == "Conversation 3"
+
+    checkpoint = outputs[0].next_checkpoint
+    assert not checkpoint.has_more
+    assert checkpoint.tickets_cursor is None
+    assert checkpoint.last_updated_at == 300
+    assert checkpoint.last_updated_ids == ["3"]
+
+
+def test_load_from_checkpoint_resumes_from_watermark(
+    intercom_connector: IntercomConnector,
+    create_mock_ticket: Callable[..., dict[str, Any]],
+) -> None:
+    """Tickets already yielded at the watermark second are not yielded again"""
+    intercom_connector._get_tickets.side_effect = [  # type: ignore[attr-defined]
+        _page(
+            [
+                create_mock_ticket(id=1, updated_at=200),
+                create_mock_ticket(id=2, updated_at=200),
+                create_mock_ticket(id=3, updated_at=300),
+            ]
+        ),
+    ]
+    checkpoint = IntercomConnectorCheckpoint(
+        has_more=True, last_updated_at=200, last_updated_ids=["1"]
+    )
+
+    outputs = load_everything_from_checkpoint_connector_from_checkpoint(
+        intercom_connector, 0, 1_000, checkpoint
+    )
+
+    # the search restarts one second before the watermark, without the cursor
+    get_tickets = intercom_connector._get_tickets
+    call_kwargs = get_tickets.call_args_list[0].kwargs  # type: ignore[attr-defined]
+    assert call_kwargs["starting_after"] is None
+    assert call_kwargs["start_ts"] == 199
+
+    assert [doc.id for doc in outputs[0].items if isinstance(doc, Document)] == [
+        "intercom_2",
+        "intercom_3",
+    ]
+    assert outputs[0].next_checkpoint.last_updated_at == 300
+
+
+def test_load_from_checkpoint_stops_at_end_of_window(
+    intercom_connector: IntercomConnector,
+    create_mock_ticket: Callable[..., dict[str, Any]],
+) -> None:
+    """Sorted results past `end` stop pagination, even when more pages remain"""
+    intercom_connector._get_tickets.side_effect = [  # type: ignore[attr-defined]
+        _page(
+            [
+                create_mock_ticket(id=1, updated_at=100),
+                create_mock_ticket(id=2, updated_at=2_000),
+            ],
+            starting_after="cursor_1",
+        ),
+        _page([create_mock_ticket(id=3, updated_at=3_000)]),
+    ]
+
+    outputs = load_everything_from_checkpoint_connector(intercom_connector, 0, 1_000)
+
+    assert len(outputs) == 1
+    assert [doc.id for doc in outputs[0].items if isinstance(doc, Document)] == [
+        "intercom_1"
+    ]
+    assert not outputs[0].next_checkpoint.has_more
+
+
+def test_conversation_parts_become_sections_and_owners(
+    intercom_connector: IntercomConnector,
+    create_mock_ticket: Callable[..., dict[str, Any]],
+) -> None:
+    """Part bodies are appended once each. The initial author stays the only
+    primary owner, people who replied become secondary owners"""
+    ticket = create_mock_ticket(id=1, updated_at=100, body="<p>Question</p>")
+    user = {"type": "user", "name": "Test User", "email": "user@example.com"}
+    admin = {"type": "admin", "name": "Admin", "email": "admin@example.com"}
+    other_admin = {"type": "admin", "name": "Other", "email": "other@example.com"}
+    bot = {"type": "bot", "name": "Bot", "email": "bot@example.com"}
+    ticket["conversation_parts"] = {
+        "conversation_parts": [
+            {"part_type": "assignment", "body": None, "author": other_admin},
+            {"part_type": "comment", "body": "Hi, how can I help?", "author": bot},
+            {"part_type": "comment", "body": "<p>Answer</p>", "author": admin},
+            {"part_type": "comment", "body": "<p>Answer</p>", "author": admin},
+            {"part_type": "comment", "body": "Thanks", "author": user},
+        ]
+    }
+    intercom_connector._get_tickets.side_effect = [  # type: ignore[attr-defined]
+        _page([ticket])
+    ]
+
+    outputs = load_everything_from_checkpoint_connector(intercom_connector, 0, 1_000)
+
+    doc = outputs[0].items[0]
+    assert isinstance(doc, Document)
+    assert [section.text for section in doc.sections] == [
+        "Question",
+        "Hi, how can I help?",
+        "Answer",
+        "Thanks",
+    ]
+    assert doc.primary_owners is not None
+    assert [owner.email for owner in doc.primary_owners] == ["user@example.com"]
+    assert doc.secondary_owners is not None
+    assert [owner.email for owner in doc.secondary_owners] == ["admin@example.com"]
+
+
+def test_load_from_checkpoint_many_tickets_in_one_second(
+    intercom_connector: IntercomConnector,
+    create_mock_ticket: Callable[..., dict[str, Any]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """More tickets sharing an `updated_at` than one call reads still make
+    progress, by continuing with the cursor instead of restarting the search"""
+    monkeypatch.setattr(intercom_module, "_PAGES_PER_CHECKPOINT", 3)
+    server = _FakeSearchServer(
+        [create_mock_ticket(id=i, updated_at=500) for i in range(30)], page_size=2
+    )
+    intercom_connector._get_tickets = server  # type: ignore[method-assign]
+
+    outputs = load_everything_from_checkpoint_connector(intercom_connector, 0, 1_000)
+
+    doc_ids = [
+        doc.id
+        for output in outputs
+        for doc in output.items
+        if isinstance(doc, Document)
+    ]
+    assert doc_ids == [f"intercom_{i}" for i in range(30)]
+    # 15 pages, 3 per call
+    assert len(outputs) == 5
+    assert all(output.items for output in outputs)
+    # every call after the first continues the original search
+    assert {start_ts for _, start_ts in server.calls} == {0}
+
+
+def test_load_from_checkpoint_requests_each_page_once(
+    intercom_connector: IntercomConnector,
+    create_mock_ticket: Callable[..., dict[str, Any]],
+) -> None:
+    """No page is prefetched past the per-call page budget or past `end`"""
+    server = _FakeSearchServer(
+        [create_mock_ticket(id=i, updated_at=100 + i) for i in range(24)]
+        + [create_mock_ticket(id=99, updated_at=5_000)],
+        page_size=2,
+    )
+    intercom_connector._get_tickets = server  # type: ignore[method-assign]
+
+    outputs = load_everything_from_checkpoint_connector(intercom_connector, 0, 1_000)
+
+    assert len(outputs) == 2
+    assert len([doc for output in outputs for doc in output.items]) == 24
+    # 12 pages in the window plus the one holding the ticket past `end`,
+    # each requested exactly once
+    assert len(server.calls) == 13
+    assert len(set(server.calls)) == 13
@@ -0,0 +1,40 @@
+import pytest
+
+import onyx.connectors.intercom.connector as intercom_module
+from onyx.connectors.intercom.connector import _clean_body
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("<p>Hi <b>there</b></p><p>second &amp; third</p>", "Hi there\nsecond & third"),
+        ("line1<br>line2", "line1\nline2"),
+        # lxml drops everything after a leading stray end tag
+        ("</p><p>My invoice is wrong</p>", "My invoice is wrong"),
+        ("</div>text", "text"),
+        ("  </span>Customer reply<br>line2", "Customer reply\nline2"),
+        ("<p></p>", ""),
+    ],
+)
+def test_clean_body_html(body: str, expected: str) -> None:
+    assert _clean_body(body) == expected
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ("Thanks, that fixed it", "Thanks, that fixed it"),
+        ("  line1\nline2  ", "line1 line2"),
+        ("a > b", "a > b"),
+    ],
+)
+def test_clean_body_plain_text_skips_parser(
+    body: str, expected: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _no_parse(*args: object, **kwargs: object) -> str:
+        raise AssertionError("plain-text bodies should not be parsed")
+
+    monkeypatch.setattr(intercom_module, "parse_html_page_basic", _no_parse)
+    _clean_body.cache_clear()
+
+    assert _clean_body(body) == expected
@@ -0,0 +1,209 @@
+import httpx
+import pytest
+import retry.api
+
+import onyx.connectors.intercom.connector as intercom_module
+from onyx.connectors.intercom.connector import _intercom_request
+from onyx.connectors.intercom.connector import _wait_for_rate_limit
+
+
+class _FakeTime:
+    """A controllable time module replacement.
+
+    - time(): returns an internal clock (seconds since the epoch)
+    - sleep(x): records the wait and advances the clock by x seconds
+    """
+
+    def __init__(self, now: float = 1_700_000_000.0) -> None:
+        self._t = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        return self._t
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(float(seconds))
+        self._t += float(seconds)
+
+
+@pytest.fixture
+def fake_time(monkeypatch: pytest.MonkeyPatch) -> _FakeTime:
+    fake = _FakeTime()
+    # Patch time both in the connector and in the retry decorator's backoff
+    monkeypatch.setattr(intercom_module, "time", fake, raising=True)
+    monkeypatch.setattr(retry.api, "time", fake, raising=True)
+    return fake
+
+
+def _client(
+    responses: list[httpx.Response],
+) -> tuple[httpx.Client, list[httpx.Request]]:
+    """A client that serves `responses` in order and records the requests"""
+    requests: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    client = httpx.Client(
+        base_url=intercom_module.BASE_URL, transport=httpx.MockTransport(_handler)
+    )
+    return client, requests
+
+
+def test_retry_after_is_honored_then_succeeds(fake_time: _FakeTime) -> None:
+    client, requests = _client(
+        [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"conversations": []}),
+        ]
+    )
+
+    response = _intercom_request(client, "GET", "/conversations")
+
+    assert response.status_code == 200
+    assert len(requests) == 2
+    # the Retry-After wait comes before the decorator's own backoff
+    assert fake_time.sleeps[0] == 3
+
+
+def test_retry_after_is_capped(fake_time: _FakeTime) -> None:
+    client, _ = _client(
+        [
+            httpx.Response(429, headers={"Retry-After": "86400"}),
+            httpx.Response(200, json={}),
+        ]
+    )
+
+    _intercom_request(client, "GET", "/conversations")
+
+    assert fake_time.sleeps[0] == intercom_module._MAX_RETRY_AFTER_SECONDS
+
+
+def test_malformed_retry_after_falls_back_to_backoff(fake_time: _FakeTime) -> None:
+    client, requests = _client(
+        [
+            httpx.Response(429, headers={"Retry-After": "soon"}),
+            httpx.Response(200, json={}),
+        ]
+    )
+
+    _intercom_request(client, "GET", "/conversations")
+
+    assert len(requests) == 2
+    # only the decorator's backoff delay
+    assert len(fake_time.sleeps) == 1
+
+
+def test_server_errors_are_retried(fake_time: _FakeTime) -> None:
+    client, requests = _client(
+        [
+            httpx.Response(502),
+            httpx.Response(503),
+            httpx.Response(200, json={}),
+        ]
+    )
+
+    response = _intercom_request(client, "GET", "/conversations")
+
+    assert response.status_code == 200
+    assert len(requests) == 3
+
+
+def test_server_errors_give_up_after_max_tries(fake_time: _FakeTime) -> None:
+    client, requests = _client([httpx.Response(500) for _ in range(6)])
+
+    with pytest.raises(intercom_module.IntercomRetriableError):
+        _intercom_request(client, "GET", "/conversations")
+
+    assert len(requests) == 6
+
+
+@pytest.mark.parametrize("status_code", [400, 401, 404])
+def test_client_errors_are_not_retried(fake_time: _FakeTime, status_code: int) -> None:
+    client, requests = _client([httpx.Response(status_code)])
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _intercom_request(client, "GET", "/conversations")
+
+    assert len(requests) == 1
+    assert fake_time.sleeps == []
+
+
+def _rate_limit_headers(remaining: int, limit: int, reset_at: float) -> httpx.Headers:
+    return httpx.Headers(
+        {
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Limit": str(limit),
+            "X-RateLimit-Reset": str(int(reset_at)),
+        }
+    )
+
+
+def test_near_exhausted_quota_waits_for_reset(fake_time: _FakeTime) -> None:
+    _wait_for_rate_limit(_rate_limit_headers(5, 100, fake_time.time() + 4))
+
+    assert fake_time.sleeps == [4]
+
+
+def test_quota_wait_is_capped(fake_time: _FakeTime) -> None:
+    _wait_for_rate_limit(_rate_limit_headers(0, 100, fake_time.time() + 3_600))
+
+    assert fake_time.sleeps == [intercom_module._MAX_RATE_LIMIT_WAIT_SECONDS]
+
+
+@pytest.mark.parametrize(
+    "remaining, reset_offset",
+    [
+        # enough headroom left
+        (10, 4),
+        (50, 4),
+        # the window has already reset
+        (0, -1),
+    ],
+)
+def test_no_wait_with_headroom_or_after_reset(
+    fake_time: _FakeTime, remaining: int, reset_offset: int
+) -> None:
+    _wait_for_rate_limit(
+        _rate_limit_headers(remaining, 100, fake_time.time() + reset_offset)
+    )
+
+    assert fake_time.sleeps == []
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Limit": "100"},
+        {
+            "X-RateLimit-Remaining": "zero",
+            "X-RateLimit-Limit": "100",
+            "X-RateLimit-Reset": "1700000004",
+        },
+    ],
+)
+def test_missing_or_malformed_headers_are_ignored(
+    fake_time: _FakeTime, headers: dict[str, str]
+) -> None:
+    _wait_for_rate_limit(httpx.Headers(headers))
+
+    assert fake_time.sleeps == []
+
+
+def test_successful_response_is_throttled(fake_time: _FakeTime) -> None:
+    client, requests = _client(
+        [
+            httpx.Response(
+                200,
+                json={},
+                headers=_rate_limit_headers(1, 100, fake_time.time() + 2),
+            )
+        ]
+    )
+
+    _intercom_request(client, "GET", "/conversations")
+
+    assert len(requests) == 1
+    assert fake_time.sleeps == [2]